@@ -2,8 +2,13 @@
 Setup script for TIA Signal Automator SDK
 """
 
+import re
 from setuptools import setup, find_packages
 
+# Single source of truth for the version is tia_sdk/__init__.py
+with open("tia_sdk/__init__.py", "r", encoding="utf-8") as fh:
+    version = re.search(r'^__version__ = "([^"]+)"', fh.read(), re.M).group(1)
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -12,7 +17,7 @@ with open("requirements.txt", "r", encoding="utf-8") as fh:
 
 setup(
     name="mudrex-signal-automator",
-    version="1.0.0",
+    version=version,
     author="Trade Ideas Automation Service",
     description="Receive live trading signals and execute automatically on Mudrex",
     long_description=long_description,
@@ -25,12 +30,13 @@ setup(
         "Topic :: Office/Business :: Financial :: Investment",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.9",
+    python_requires=">=3.11",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "signal-sdk=tia_sdk.cli:main",
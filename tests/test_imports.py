@@ -0,0 +1,53 @@
+"""
+Import-time regression tests.
+
+Importing the package or the CLI entry point must not load the
+WebSocket client, the Mudrex SDK or the TOML libraries; they are only
+imported by the code paths that use them. Each check runs in a fresh
+interpreter so modules already imported by the test runner don't count.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loaded_after(code: str, modules: tuple) -> list[str]:
+    """Run ``code`` in a new interpreter and return which of ``modules`` it loaded."""
+    script = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {list(modules)!r} if m in sys.modules]))"
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env, cwd=ROOT
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+class ImportCostTest(unittest.TestCase):
+
+    def test_package_import_is_light(self):
+        loaded = _loaded_after("import tia_sdk", ("websockets", "mudrex", "tomllib", "tomli_w", "toml", "click", "rich"))
+        self.assertEqual(loaded, [])
+
+    def test_cli_import_is_light(self):
+        loaded = _loaded_after("import tia_sdk.cli", ("websockets", "mudrex", "tomllib", "tomli_w", "toml", "click", "rich", "asyncio"))
+        self.assertEqual(loaded, [])
+
+    def test_version_fast_path_skips_click(self):
+        code = "import sys\nsys.argv = ['signal-sdk', '--version']\nfrom tia_sdk.cli import main\nmain()"
+        self.assertEqual(_loaded_after(code, ("click", "rich")), [])
+
+    def test_config_import_is_light(self):
+        loaded = _loaded_after("import tia_sdk.config", ("tomllib", "tomli_w", "dotenv", "pydantic"))
+        self.assertEqual(loaded, [])
+
+    def test_executor_import_skips_mudrex(self):
+        self.assertNotIn("mudrex", _loaded_after("import tia_sdk.executor", ("mudrex",)))
+
+
+if __name__ == "__main__":
+    unittest.main()
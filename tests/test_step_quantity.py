@@ -0,0 +1,42 @@
+"""
+Tests for rounding order quantities to an asset's quantity step.
+"""
+
+import unittest
+
+from tia_sdk.executor import _qty_step, _step_quantity
+
+
+class StepQuantityTest(unittest.TestCase):
+
+    def step(self, quantity, quantity_step):
+        return _step_quantity(quantity, _qty_step(quantity_step))
+
+    def test_rounds_to_nearest_step(self):
+        # 10 USDT x 5 @ 63000.5 is 0.00079...; rounding down would give zero
+        self.assertEqual(self.step(10 * 5 / 63000.5, "0.001"), (0.001, "0.001"))
+        self.assertEqual(self.step(0.0123, "0.01"), (0.01, "0.01"))
+
+    def test_ties_round_half_even(self):
+        self.assertEqual(self.step(0.0025, "0.001"), (0.002, "0.002"))
+        self.assertEqual(self.step(0.0035, "0.001"), (0.004, "0.004"))
+
+    def test_string_has_step_precision(self):
+        self.assertEqual(self.step(0.25, "0.001"), (0.25, "0.250"))
+        self.assertEqual(self.step(2, "0.1"), (2.0, "2.0"))
+        # Trailing zeros in the step itself don't add places
+        self.assertEqual(self.step(0.25, "0.0010"), (0.25, "0.250"))
+        self.assertEqual(self.step(0.25, 0.001), (0.25, "0.250"))
+
+    def test_below_half_a_step_is_zero(self):
+        self.assertEqual(self.step(0.0004, "0.001"), (0.0, "0.000"))
+        self.assertEqual(self.step(0.4, "1"), (0.0, "0"))
+
+    def test_whole_number_steps(self):
+        self.assertEqual(self.step(12.6, "1"), (13.0, "13"))
+        self.assertEqual(self.step(37, "10"), (40.0, "40"))
+        self.assertEqual(self.step(7.4, 1.0), (7.0, "7"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,8 +7,26 @@ Receive live trading signals and execute automatically on Mudrex.
 __version__ = "1.0.0"
 __author__ = "Trade Ideas Automation Service"
 
-from .client import SignalClient
-from .executor import TradeExecutor
-from .config import Config
-
 __all__ = ["SignalClient", "TradeExecutor", "Config"]
+
+# Public classes are imported on first attribute access (PEP 562) so that
+# importing the package (e.g. via the CLI entry point) stays cheap.
+_LAZY = {
+    "SignalClient": ".client",
+    "TradeExecutor": ".executor",
+    "Config": ".config",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,24 @@
+"""
+CLI interface for Mudrex Signal Automator SDK.
+
+``main`` is the console-script entry point. ``--version``/``-V`` is
+answered here without importing click; everything else is dispatched to
+the click group in ``_group``, which imports a command's module only
+when that command is used.
+"""
+
+import sys
+
+# Console-script name, shown by both --version code paths
+PROG_NAME = "signal-sdk"
+
+
+def main():
+    """Mudrex Signal Automator - Receive and execute live trading signals."""
+    if sys.argv[1:2] in (["--version"], ["-V"]):
+        from .. import __version__
+        print(f"{PROG_NAME}, version {__version__}")
+        return
+    
+    from ._group import cli
+    cli()
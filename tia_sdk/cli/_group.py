@@ -0,0 +1,74 @@
+"""
+Click command group for the CLI.
+"""
+
+import functools
+import importlib
+import os
+
+import click
+
+from .. import __version__
+from . import PROG_NAME
+
+# Command name -> module in tia_sdk.cli.commands
+COMMANDS = {
+    "init": "init",
+    "setup": "setup",
+    "start": "start",
+    "doctor": "doctor",
+    "status": "status",
+    "test": "test",
+    "history": "history",
+}
+
+# Entry point group other packages can use to add commands
+PLUGIN_GROUP = "tia_sdk.commands"
+
+# Set to list plugin commands in --help as well (costs a distribution scan)
+LIST_PLUGINS_ENV = "SIGNAL_SDK_LIST_PLUGINS"
+
+
+@functools.cache
+def _plugin_commands() -> dict:
+    """
+    Commands registered by installed packages, as name -> entry point.
+    
+    Scanning installed distributions is far slower than a dict lookup, so
+    this only runs for names that are not built in, and for listings
+    when ``SIGNAL_SDK_LIST_PLUGINS`` is set.
+    """
+    from importlib.metadata import entry_points
+    return {ep.name: ep for ep in entry_points(group=PLUGIN_GROUP) if ep.name not in COMMANDS}
+
+
+class LazyGroup(click.Group):
+    """
+    Group that imports a command's module only when it is needed.
+    
+    Built-in commands come from ``COMMANDS``; other packages can add
+    commands by registering a ``click.Command`` under the
+    ``tia_sdk.commands`` entry point group. Plugin commands always run,
+    but are only listed in ``--help`` when ``SIGNAL_SDK_LIST_PLUGINS`` is
+    set, so plain ``--help`` doesn't scan installed packages.
+    """
+    
+    def list_commands(self, ctx):
+        if os.environ.get(LIST_PLUGINS_ENV):
+            return sorted({*COMMANDS, *_plugin_commands()})
+        return sorted(COMMANDS)
+    
+    def get_command(self, ctx, cmd_name):
+        module_name = COMMANDS.get(cmd_name)
+        if module_name is None:
+            plugin = _plugin_commands().get(cmd_name)
+            return plugin.load() if plugin is not None else None
+        module = importlib.import_module(f"{__package__}.commands.{module_name}")
+        return module.cmd
+
+
+@click.group(cls=LazyGroup)
+@click.version_option(__version__, "-V", "--version", prog_name=PROG_NAME)
+def cli():
+    """Mudrex Signal Automator - Receive and execute live trading signals."""
+    pass
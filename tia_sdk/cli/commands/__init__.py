@@ -0,0 +1,3 @@
+"""
+CLI commands - one module per command, each exposing a click command as ``cmd``.
+"""
@@ -0,0 +1,163 @@
+"""
+``signal-sdk doctor`` - Diagnose connectivity and configuration issues.
+"""
+
+import sys
+
+import click
+
+from .._common import get_console
+
+
+@click.command("doctor")
+@click.option('--config', '-c', default='config.toml', help='Config file path')
+def cmd(config):
+    """Diagnose connectivity and configuration issues."""
+    import asyncio
+    import os.path
+    from ...config import Config
+    console = get_console()
+    
+    console.print("[bold]🩺 Signal SDK Doctor[/bold]\n")
+    
+    all_ok = True
+    
+    # Check 1: Config file exists
+    console.print("[bold]1. Configuration File[/bold]")
+    if os.path.exists(config):
+        console.print(f"   [green]✅ Found: {config}[/green]")
+    else:
+        console.print(f"   [red]❌ Not found: {config}[/red]")
+        console.print("   [dim]Run 'signal-sdk setup' to create one[/dim]")
+        sys.exit(1)
+    
+    # Load config
+    try:
+        cfg = Config(config)
+        console.print("   [green]✅ Config loaded successfully[/green]")
+    except Exception as e:
+        console.print(f"   [red]❌ Failed to load config: {e}[/red]")
+        sys.exit(1)
+    
+    # Check 2: Config validation
+    console.print("\n[bold]2. Configuration Validation[/bold]")
+    is_valid, errors = cfg.validate()
+    if is_valid:
+        console.print("   [green]✅ All required fields present[/green]")
+    else:
+        all_ok = False
+        console.print("   [red]❌ Configuration errors:[/red]")
+        for error in errors:
+            console.print(f"      • {error}")
+    
+    # Checks 3 and 4 are independent network probes, so run them
+    # concurrently in a single event loop and report the results in order.
+    placeholder_url = "your-broadcaster" in cfg.broadcaster.url or "example" in cfg.broadcaster.url.lower()
+    
+    async def test_broadcaster():
+        try:
+            from ...client import SignalClient
+            async with SignalClient(cfg) as client:
+                if client.is_connected:
+                    return True, "Connected successfully"
+                return False, "Connection failed"
+        except Exception as e:
+            return False, str(e)
+    
+    async def test_mudrex():
+        try:
+            from ...executor import TradeExecutor
+            executor = TradeExecutor(cfg)
+            return await executor.validate_credentials()
+        except Exception as e:
+            return False, str(e)
+    
+    async def skipped():
+        return None
+    
+    async def run_checks():
+        return await asyncio.gather(
+            skipped() if placeholder_url else test_broadcaster(),
+            test_mudrex() if cfg.mudrex.api_secret else skipped(),
+            return_exceptions=True
+        )
+    
+    console.print("\n[dim]Testing broadcaster and Mudrex API...[/dim]")
+    broadcaster_result, mudrex_result = asyncio.run(run_checks())
+    
+    # Check 3: Broadcaster connection
+    console.print("\n[bold]3. Broadcaster Connection[/bold]")
+    console.print(f"   [dim]URL: {cfg.broadcaster.url}[/dim]")
+    
+    # Check if URL is placeholder
+    if placeholder_url:
+        all_ok = False
+        console.print("   [yellow]⚠️  Placeholder URL detected[/yellow]")
+        console.print("   [dim]Please update config.toml with your actual broadcaster URL[/dim]")
+        console.print("   [dim]Example: wss://your-broadcaster.railway.app/ws[/dim]")
+    elif isinstance(broadcaster_result, Exception):
+        all_ok = False
+        error_msg = str(broadcaster_result)
+        console.print(f"   [red]❌ Error: {error_msg}[/red]")
+        if "Name or service not known" in error_msg or "Failed to resolve" in error_msg:
+            console.print("   [dim]Troubleshooting:[/dim]")
+            console.print("   • Check if the broadcaster URL is correct")
+            console.print("   • Ensure the broadcaster service is running")
+    else:
+        success, msg = broadcaster_result
+        if success:
+            console.print(f"   [green]✅ {msg}[/green]")
+        else:
+            all_ok = False
+            console.print(f"   [red]❌ {msg}[/red]")
+            console.print("   [dim]Troubleshooting:[/dim]")
+            console.print("   • Check your internet connection")
+            console.print("   • Verify the broadcaster URL is correct")
+            console.print("   • The service may be temporarily down")
+    
+    # Check 4: Mudrex API
+    console.print("\n[bold]4. Mudrex API[/bold]")
+    
+    if not cfg.mudrex.api_secret:
+        all_ok = False
+        console.print("   [red]❌ API Secret not configured[/red]")
+    elif isinstance(mudrex_result, Exception):
+        all_ok = False
+        console.print(f"   [red]❌ Error: {mudrex_result}[/red]")
+    else:
+        success, msg = mudrex_result
+        if success:
+            console.print(f"   [green]✅ {msg}[/green]")
+        else:
+            all_ok = False
+            console.print(f"   [red]❌ {msg}[/red]")
+            
+            # Provide specific troubleshooting
+            if "Invalid API Secret" in msg:
+                console.print("\n   [bold]What to do:[/bold]")
+                console.print("   • Go to Mudrex → Settings → API Management")
+                console.print("   • Copy your API Secret (the entire long string)")
+                console.print("   • Update config.toml with the correct secret")
+                console.print("   • Make sure you copied all characters")
+            elif "Futures Trading" in msg:
+                console.print("\n   [bold]What to do:[/bold]")
+                console.print("   • Go to Mudrex → Settings → API Management")
+                console.print("   • Click on your API key to edit it")
+                console.print("   • Enable 'Futures Trading' permission")
+                console.print("   • Save and try again")
+            elif "temporarily unavailable" in msg or "Connection" in msg:
+                console.print("\n   [bold]What to do:[/bold]")
+                console.print("   • Check your internet connection")
+                console.print("   • Wait a few minutes and try again")
+                console.print("   • The Mudrex service may be temporarily down")
+    
+    # Summary
+    console.print("\n" + "=" * 40)
+    if all_ok:
+        console.print("[bold green]✅ All checks passed![/bold green]")
+        console.print("\n[dim]You're ready to start:[/dim]")
+        console.print("  [cyan]signal-sdk start[/cyan]")
+    else:
+        console.print("[bold red]❌ Some checks failed[/bold red]")
+        console.print("\n[dim]Fix the issues above and run doctor again[/dim]")
+        sys.exit(1)
@@ -0,0 +1,17 @@
+"""
+``signal-sdk history`` - View trade history.
+"""
+
+import click
+
+from .._common import get_console
+
+
+@click.command("history")
+@click.option('--limit', '-n', default=10, help='Number of recent trades')
+def cmd(limit):
+    """View trade history."""
+    console = get_console()
+    
+    console.print("[yellow]Trade history feature coming soon![/yellow]")
+    console.print("[dim]Will display recent trade executions and results[/dim]")
@@ -0,0 +1,35 @@
+"""
+``signal-sdk init`` - Generate a configuration file.
+"""
+
+import sys
+
+import click
+
+from .._common import get_console
+
+
+@click.command("init")
+@click.option('--output', '-o', default='config.toml', help='Output config file path')
+def cmd(output):
+    """Generate configuration file (advanced users)."""
+    import os.path
+    from ...config import Config
+    console = get_console()
+    
+    try:
+        if os.path.exists(output):
+            if not click.confirm(f'{output} already exists. Overwrite?'):
+                console.print("[yellow]Cancelled[/yellow]")
+                return
+        
+        Config.generate_example(output)
+        console.print(f"[green]✅ Config generated: {output}[/green]")
+        console.print("\n[bold]Next steps:[/bold]")
+        console.print(f"1. Edit {output} with your credentials")
+        console.print("2. Run: signal-sdk start")
+        console.print("\n[dim]Tip: Use 'signal-sdk setup' for interactive configuration[/dim]")
+    
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,270 @@
+"""
+``signal-sdk setup`` - Interactive first-time setup.
+"""
+
+import sys
+
+import click
+
+from .._common import get_console
+
+
+# Shared thread pool for blocking Mudrex SDK calls
+_io_executor_instance = None
+
+# Troubleshooting steps shown by setup, keyed by a substring of the
+# credential validation error
+_SETUP_ERROR_HELP = {
+    "Invalid API Secret": [
+        "• Go to Mudrex → Settings → API Management",
+        "• Copy your API Secret (the entire long string)",
+        "• Make sure you copied all characters - no missing parts",
+        "• Run 'signal-sdk setup' again with the correct secret",
+    ],
+    "Futures Trading": [
+        "• Go to Mudrex → Settings → API Management",
+        "• Click on your API key to edit it",
+        "• Enable 'Futures Trading' permission",
+        "• Save and try again",
+    ],
+}
+_SETUP_ERROR_HELP_DEFAULT = [
+    "• Check your internet connection",
+    "• Verify your API Secret is correct",
+    "• Try again in a few moments",
+]
+
+
+def _io_executor():
+    """Return the shared thread pool for blocking calls, creating it on first use."""
+    global _io_executor_instance
+    if _io_executor_instance is None:
+        import atexit
+        from concurrent.futures import ThreadPoolExecutor
+        _io_executor_instance = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tia-io")
+        atexit.register(_io_executor_instance.shutdown, wait=False)
+    return _io_executor_instance
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """Run a blocking function on the shared thread pool."""
+    import asyncio
+    import functools
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor(), functools.partial(fn, *args, **kwargs))
+
+
+@click.command("setup")
+@click.option('--output', '-o', default='config.toml', help='Config file path')
+def cmd(output):
+    """Interactive setup - easiest way to get started!"""
+    import os.path
+    console = get_console()
+    runner = None
+    
+    try:
+        console.print("[bold green]🚀 Mudrex Signal Automator - Setup[/bold green]\n")
+        
+        # Check if config exists
+        if os.path.exists(output):
+            if not click.confirm(f'{output} already exists. Overwrite?'):
+                console.print("[yellow]Setup cancelled[/yellow]")
+                return
+        
+        console.print("[bold]Mudrex API Credentials[/bold]")
+        console.print("[dim]Get these from Mudrex Settings → API Management[/dim]")
+        console.print("[dim]Required permissions: Futures Trading[/dim]\n")
+        console.print("[yellow]⚠️  Important:[/yellow]")
+        console.print("   • Your API Secret is a long string (usually 40+ characters)")
+        console.print("   • Copy the ENTIRE secret - don't miss any characters")
+        console.print("   • Make sure 'Futures Trading' permission is enabled")
+        console.print("   • The secret will be validated immediately\n")
+        
+        # Prompt for Mudrex credentials with validation
+        while True:
+            mudrex_api_secret = click.prompt("🔑 Mudrex API Secret", type=str, hide_input=True)
+            
+            # Basic format validation
+            if not mudrex_api_secret or len(mudrex_api_secret.strip()) < 10:
+                console.print("[red]❌ API Secret appears too short. Please check and try again.[/red]")
+                console.print("[dim]API Secrets are typically 40+ characters long[/dim]\n")
+                if not click.confirm("Try again?", default=True):
+                    console.print("[yellow]Setup cancelled[/yellow]")
+                    sys.exit(0)
+                continue
+            
+            # Check for common mistakes
+            if mudrex_api_secret.strip() in ["your_mudrex_api_secret", "your-secret", "api_secret", ""]:
+                console.print("[red]❌ Please enter your actual API Secret, not a placeholder[/red]\n")
+                if not click.confirm("Try again?", default=True):
+                    console.print("[yellow]Setup cancelled[/yellow]")
+                    sys.exit(0)
+                continue
+            
+            break
+        
+        # Validate credentials immediately. Heavier imports are deferred
+        # until here so cancelling at a prompt above exits straight away.
+        import asyncio
+        console.print("\n[dim]Validating credentials...[/dim]")
+        
+        # One event loop for all of setup's network checks
+        runner = asyncio.Runner()
+        
+        async def validate_creds():
+            try:
+                from mudrex import MudrexClient
+                client = MudrexClient(api_secret=mudrex_api_secret)
+                balance = await _run_blocking(client.wallet.get_futures_balance)
+                return True, float(balance.available)  # mudrex library uses .available
+            except Exception as e:
+                error_msg = str(e)
+                if "401" in error_msg or "Unauthorized" in error_msg.lower():
+                    return False, "Invalid API Secret - Please check your API Secret from Mudrex Settings"
+                elif "403" in error_msg or "Forbidden" in error_msg.lower():
+                    return False, "API Secret missing 'Futures Trading' permission - Enable it in Mudrex Settings"
+                elif "aut" in error_msg.lower() or "auth" in error_msg.lower():
+                    return False, "Invalid API Secret - Please enter your correct API Secret"
+                else:
+                    # Try to extract meaningful error message
+                    if "connection" in error_msg.lower() or "network" in error_msg.lower():
+                        return False, "Connection error - Check your internet connection"
+                    elif "timeout" in error_msg.lower():
+                        return False, "Connection timeout - Please try again"
+                    else:
+                        return False, f"Unable to validate API Secret - {error_msg[:100]}"
+        
+        valid, result = runner.run(validate_creds())
+        from rich.markup import escape
+        
+        if not valid:
+            help_key = next((k for k in _SETUP_ERROR_HELP if k in result), None)
+            console.print("\n".join([
+                f"\n[red]❌ {escape(result)}[/red]",
+                "\n[bold]What to do:[/bold]",
+                *_SETUP_ERROR_HELP.get(help_key, _SETUP_ERROR_HELP_DEFAULT),
+                "\n[yellow]Need help? Run 'signal-sdk doctor' for detailed diagnostics[/yellow]",
+            ]))
+            sys.exit(1)
+        
+        console.print(f"[green]✅ Credentials valid! Balance: {result:.2f} USDT[/green]")
+        
+        console.print("\n[bold]Trading Parameters[/bold]")
+        console.print("[dim]Minimum trade amount: 5.0 USDT (Mudrex requirement)[/dim]\n")
+        trade_amount = click.prompt("💰 Trade Amount per Signal (USDT)", type=float, default=5.0)
+        
+        # Validate minimum
+        if trade_amount < 5.0:
+            console.print("[yellow]⚠️  Trade amount below minimum (5.0 USDT). Setting to 5.0 USDT[/yellow]")
+            trade_amount = 5.0
+        
+        max_leverage = click.prompt("⚡ Maximum Leverage", type=int, default=25)
+        
+        # Broadcaster URL configuration
+        from ...constants import BROADCASTER_URL
+        console.print("\n[bold]Broadcaster Connection[/bold]")
+        console.print("[dim]WebSocket URL where signals are broadcast from[/dim]")
+        console.print(f"[dim]Default: {BROADCASTER_URL}[/dim]\n")
+        broadcaster_url = click.prompt(
+            "🌐 Broadcaster WebSocket URL",
+            type=str,
+            default=BROADCASTER_URL,
+            show_default=False
+        )
+        
+        # Validate URL format
+        if not broadcaster_url.startswith(("ws://", "wss://")):
+            console.print("[yellow]⚠️  URL should start with ws:// or wss://[/yellow]")
+            console.print("[yellow]   Using default URL instead[/yellow]")
+            broadcaster_url = BROADCASTER_URL
+        
+        # Optional: Telegram ID for notifications
+        console.print("\n[bold]Optional Settings[/bold]")
+        telegram_id = click.prompt("📱 Telegram ID (for notifications, optional)", type=int, default=0)
+        
+        # Generate client ID
+        import secrets
+        client_id = f"sdk-{secrets.token_hex(4)}"
+        
+        # Create config
+        import tomli_w
+        config_data = {
+            "broadcaster": {
+                "url": broadcaster_url,
+                "client_id": client_id
+            },
+            "mudrex": {
+                "api_secret": mudrex_api_secret
+            },
+            "trading": {
+                "enabled": True,
+                "trade_amount_usdt": trade_amount,
+                "max_leverage": max_leverage,
+                "min_order_value": 5.0,  # Mudrex minimum requirement
+                "auto_execute": True
+            },
+            "risk": {
+                "max_daily_trades": 999999,  # Disabled (no limit)
+                "max_open_positions": 999999,  # Disabled (no limit)
+                "stop_on_daily_loss": 0.0,  # Disabled
+                "min_balance": 0.0  # Disabled (no minimum)
+            },
+            "logging": {
+                "level": "INFO",
+                "file": "signal_sdk.log",
+                "console": True,
+                "rotate": True,
+                "rotate_when": "midnight",
+                "max_bytes": 10485760,
+                "backup_count": 5
+            }
+        }
+        
+        # TOML has no null - leave telegram_id out when not provided
+        if telegram_id > 0:
+            config_data["broadcaster"]["telegram_id"] = telegram_id
+        
+        # Save config (serialized in memory, written in one call)
+        with open(output, 'wb') as f:
+            f.write(tomli_w.dumps(config_data).encode("utf-8"))
+        
+        console.print(f"\n[green]✅ Configuration saved to {output}[/green]")
+        
+        # Test broadcaster connection
+        console.print("\n[bold]Testing broadcaster connection...[/bold]")
+        
+        async def test_conn(timeout: float = 5.0):
+            try:
+                from ...config import Config
+                from ...client import SignalClient
+                cfg = Config.from_dict(config_data, output)
+                # A dead broadcaster must not stall the wizard
+                async with asyncio.timeout(timeout):
+                    async with SignalClient(cfg) as client:
+                        return client.is_connected
+            except:
+                return False
+        
+        if runner.run(test_conn()):
+            console.print("[green]✅ Broadcaster connection successful![/green]")
+        else:
+            console.print("[yellow]⚠️  Could not connect to broadcaster[/yellow]")
+            console.print("[dim]This may be normal if the service is starting up[/dim]")
+        
+        console.print("\n[bold green]🎉 Setup complete![/bold green]")
+        console.print("\n[bold]Next step:[/bold]")
+        console.print("  [cyan]signal-sdk start[/cyan]")
+        console.print("\n[dim]Your configuration is saved in config.toml[/dim]")
+    
+    except (KeyboardInterrupt, click.Abort):
+        # click.prompt turns Ctrl-C into click.Abort
+        console.print("\n[yellow]Setup cancelled[/yellow]")
+        sys.exit(0)
+    
+    except Exception as e:
+        console.print(f"\n[red]❌ Setup failed: {e}[/red]")
+        sys.exit(1)
+    
+    finally:
+        if runner is not None:
+            runner.close()
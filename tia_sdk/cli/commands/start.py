@@ -0,0 +1,179 @@
+"""
+``signal-sdk start`` - Receive and execute signals.
+"""
+
+import sys
+
+import click
+
+from ... import __version__
+from .._common import get_console
+
+
+async def _console_writer(queue, max_batch: int = 16, flush_after: float = 0.01):
+    """
+    Print ``rich.text.Text`` lines queued by the signal callbacks.
+    
+    Lines arriving within ``flush_after`` seconds of each other are
+    printed together, so a burst of signals results in a few console
+    writes instead of one per line.
+    """
+    import asyncio
+    from rich.text import Text
+    console = get_console()
+    newline = Text("\n")
+    while True:
+        lines = [await queue.get()]
+        await asyncio.sleep(flush_after)
+        while len(lines) < max_batch and not queue.empty():
+            lines.append(queue.get_nowait())
+        console.print(newline.join(lines))
+
+
+def _flush_console_queue(queue):
+    """Print whatever is still queued (used on shutdown)."""
+    from rich.text import Text
+    lines = []
+    while not queue.empty():
+        lines.append(queue.get_nowait())
+    if lines:
+        get_console().print(Text("\n").join(lines))
+
+
+@click.command("start")
+@click.option('--config', '-c', default='config.toml', help='Config file path')
+def cmd(config):
+    """Start receiving and executing signals."""
+    import asyncio
+    import logging
+    from ...config import Config
+    from ..._logging import setup_logging, stop_logging
+    console = get_console()
+    
+    try:
+        # Load config
+        try:
+            cfg = Config(config)
+        except FileNotFoundError:
+            console.print(f"[red]❌ Config file not found: {config}[/red]")
+            console.print("\n[bold]Quick fix:[/bold]")
+            console.print("  [cyan]signal-sdk setup[/cyan]")
+            sys.exit(1)
+        except Exception as e:
+            console.print(f"[red]❌ Config Error: {e}[/red]")
+            console.print("\n[bold]Run setup to fix:[/bold]")
+            console.print("  [cyan]signal-sdk setup[/cyan]")
+            sys.exit(1)
+        
+        # Validate config
+        is_valid, errors = cfg.validate()
+        if not is_valid:
+            console.print("[red]❌ Configuration errors:[/red]")
+            for error in errors:
+                console.print(f"  • {error}")
+            console.print("\n[bold]Run setup to fix:[/bold]")
+            console.print("  [cyan]signal-sdk setup[/cyan]")
+            sys.exit(1)
+        
+        # Setup logging
+        setup_logging(cfg, console)
+        
+        console.print(f"[bold green]🚀 Mudrex Signal Automator v{__version__}[/bold green]")
+        console.print(f"[dim]Connected as: {cfg.broadcaster.client_id}[/dim]\n")
+        
+        # Validate Mudrex credentials before starting
+        console.print("[dim]Validating Mudrex credentials...[/dim]")
+        
+        try:
+            # Imported only once the config is known to be usable
+            from ...executor import TradeExecutor
+            executor = TradeExecutor(cfg)
+            
+            async def validate_api():
+                return await executor.validate_credentials()
+            
+            valid, msg = asyncio.run(validate_api())
+            
+            if not valid:
+                console.print(f"[red]❌ Mudrex API Error: {msg}[/red]")
+                console.print("\n[bold]Run 'signal-sdk doctor' to diagnose[/bold]")
+                sys.exit(1)
+            
+            console.print(f"[green]✅ Mudrex API: {msg}[/green]\n")
+        
+        except Exception as e:
+            console.print(f"[red]❌ Failed to initialize: {e}[/red]")
+            sys.exit(1)
+        
+        # Create client
+        from ...client import SignalClient
+        client = SignalClient(cfg)
+        
+        # Setup callbacks - output goes through a queue drained by a
+        # single writer task so callbacks never block on the terminal.
+        # Lines are pre-styled Text objects, which skips markup parsing.
+        from rich.text import Text
+        out_q = asyncio.Queue()
+        
+        async def on_connected():
+            out_q.put_nowait(Text("✅ Connected to broadcaster", style="green"))
+        
+        async def on_disconnected():
+            out_q.put_nowait(Text("⚠️  Disconnected from broadcaster", style="yellow"))
+        
+        # Each event is printed as one line: "<header> → <result>"
+        def event_line(header, style, result, ok_label=""):
+            if result.success:
+                outcome = (f"✅ {ok_label}{result.message}", "green")
+            else:
+                outcome = (f"❌ {'Failed: ' if ok_label else ''}{result.message}", "red")
+            return Text.assemble((header, style), " → ", outcome)
+        
+        async def on_signal(signal):
+            result = await executor.execute_signal(signal)
+            out_q.put_nowait(event_line(
+                f"📡 Signal: {signal.signal_type.value} {signal.symbol}", "cyan", result, "Executed: "
+            ))
+        
+        async def on_close(close):
+            result = await executor.close_position(close)
+            out_q.put_nowait(event_line(f"🔒 Close: {close.symbol} ({close.percentage}%)", "yellow", result))
+        
+        async def on_edit_sltp(edit):
+            result = await executor.update_sl_tp(edit)
+            out_q.put_nowait(event_line(f"✏️  Edit SL/TP: {edit.symbol}", "blue", result))
+        
+        async def on_leverage(lev):
+            result = await executor.update_leverage(lev)
+            out_q.put_nowait(event_line(f"⚡ Leverage: {lev.symbol} → {lev.leverage}x", "magenta", result))
+        
+        client.on_connected = on_connected
+        client.on_disconnected = on_disconnected
+        client.on_signal = on_signal
+        client.on_close = on_close
+        client.on_edit_sltp = on_edit_sltp
+        client.on_leverage = on_leverage
+        
+        # Run client
+        console.print("[dim]Connecting to broadcaster...[/dim]\n")
+        
+        async def run():
+            writer = asyncio.create_task(_console_writer(out_q))
+            try:
+                await client.start()
+            finally:
+                writer.cancel()
+                _flush_console_queue(out_q)
+        
+        asyncio.run(run())
+    
+    except KeyboardInterrupt:
+        stop_logging()
+        console.print("\n[yellow]👋 Shutdown requested[/yellow]")
+        sys.exit(0)
+    
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        logging.exception("Fatal error")
+        stop_logging()
+        sys.exit(1)
@@ -0,0 +1,63 @@
+"""
+``signal-sdk status`` - Show configuration status.
+"""
+
+import sys
+
+import click
+
+from .._common import get_console
+
+
+@click.command("status")
+@click.option('--config', '-c', default='config.toml', help='Config file path')
+def cmd(config):
+    """Check SDK configuration and connection status."""
+    from ...config import Config
+    console = get_console()
+    
+    try:
+        cfg = Config(config)
+        
+        rows = [
+            ("Broadcaster URL", cfg.broadcaster.url),
+            ("Client ID", cfg.broadcaster.client_id),
+            ("Telegram ID", str(cfg.broadcaster.telegram_id) if cfg.broadcaster.telegram_id else "Not set"),
+            ("Trade Amount", f"{cfg.trading.trade_amount_usdt} USDT"),
+            ("Max Leverage", f"{cfg.trading.max_leverage}x"),
+            ("Auto Execute", "✅ Enabled" if cfg.trading.auto_execute else "❌ Disabled"),
+            ("Trading", "✅ Enabled" if cfg.trading.enabled else "❌ Disabled"),
+        ]
+        
+        # Display config summary - plain "key: value" lines when piped
+        if console.is_terminal:
+            from rich.table import Table
+            from rich.text import Text
+            table = Table(title="SDK Configuration")
+            table.add_column("Setting", style="cyan")
+            table.add_column("Value", style="green")
+            # Text cells are rendered as-is, without a markup parse per cell
+            for setting, value in rows:
+                table.add_row(Text(setting), Text(value))
+            console.print(table)
+        else:
+            for setting, value in rows:
+                click.echo(f"{setting}: {value}")
+        
+        # Validate
+        is_valid, errors = cfg.validate()
+        if is_valid:
+            console.print("\n[green]✅ Configuration is valid[/green]")
+        else:
+            console.print("\n[red]❌ Configuration errors:[/red]")
+            for error in errors:
+                console.print(f"  • {error}")
+    
+    except FileNotFoundError:
+        console.print(f"[red]❌ Config file not found: {config}[/red]")
+        console.print("[dim]Run 'signal-sdk setup' to create one[/dim]")
+        sys.exit(1)
+    
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,45 @@
+"""
+``signal-sdk test`` - Test the broadcaster connection.
+"""
+
+import sys
+
+import click
+
+from .._common import get_console
+
+
+@click.command("test")
+@click.option('--config', '-c', default='config.toml', help='Config file path')
+def cmd(config):
+    """Test connection to broadcaster."""
+    import asyncio
+    from ...config import Config
+    from ...client import SignalClient
+    console = get_console()
+    
+    async def test_connection():
+        try:
+            cfg = Config(config)
+            
+            console.print("[dim]Testing connection...[/dim]\n")
+            
+            async with SignalClient(cfg) as client:
+                if client.is_connected:
+                    console.print("[green]✅ Connection successful![/green]")
+                    return True
+                else:
+                    console.print("[red]❌ Connection failed[/red]")
+                    return False
+        
+        except Exception as e:
+            console.print(f"[red]❌ Error: {e}[/red]")
+            return False
+    
+    try:
+        success = asyncio.run(test_connection())
+        sys.exit(0 if success else 1)
+    
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        sys.exit(1)
@@ -3,11 +3,14 @@ WebSocket client for receiving signals from broadcaster.
 """
 
 import asyncio
-import json
 import logging
 import websockets
 from typing import Optional, Callable, Awaitable
-from datetime import datetime
+
+try:
+    import orjson as _json
+except ImportError:  # optional speedup, see the "fast" extra
+    import json as _json
 
 from .config import Config
 from .models import Signal, CloseCommand, EditSLTPCommand, LeverageCommand
@@ -24,6 +27,7 @@ class SignalClient:
         self.running = False
         self.reconnect_delay = 5
         self.max_reconnect_delay = 300  # 5 minutes
+        self.stable_connection_time = 60  # seconds connected before the delay resets
         
         # Callbacks
         self.on_signal: Optional[Callable[[Signal], Awaitable]] = None
@@ -32,30 +36,61 @@ class SignalClient:
         self.on_leverage: Optional[Callable[[LeverageCommand], Awaitable]] = None
         self.on_connected: Optional[Callable[[], Awaitable]] = None
         self.on_disconnected: Optional[Callable[[], Awaitable]] = None
+        
+        # Message type -> handler
+        self._dispatch = {
+            "NEW_SIGNAL": self._handle_new_signal,
+            "CLOSE_SIGNAL": self._handle_close_signal,
+            "EDIT_SLTP": self._handle_edit_sltp,
+            "UPDATE_LEVERAGE": self._handle_leverage,
+        }
+    
+    async def __aenter__(self):
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+    
+    @property
+    def is_connected(self) -> bool:
+        """Whether a WebSocket connection is currently open."""
+        return self.ws is not None
+    
+    def _ws_url(self) -> str:
+        """Build WebSocket URL with client_id as query parameter."""
+        return f"{self.config.broadcaster.url}?client_id={self.config.broadcaster.client_id}"
+    
+    def _connect(self):
+        """Create a websockets connector.
+        
+        Keepalive uses protocol-level ping/pong frames handled by the library.
+        """
+        return websockets.connect(
+            self._ws_url(),
+            ping_interval=20,
+            ping_timeout=20,
+            max_queue=64,
+            max_size=2**20
+        )
     
     async def connect(self):
         """Connect to broadcaster WebSocket."""
         try:
-            # Build WebSocket URL with client_id as query parameter
-            ws_url = f"{self.config.broadcaster.url}?client_id={self.config.broadcaster.client_id}"
-            
-            logger.info(f"Connecting to broadcaster: {ws_url}")
+            logger.info("Connecting to broadcaster: %s", self._ws_url())
             
             # Public service - no authentication required
-            self.ws = await websockets.connect(ws_url)
+            self.ws = await self._connect()
             
             logger.info("✅ Connected to broadcaster")
             
             if self.on_connected:
                 await self.on_connected()
             
-            # Reset reconnect delay on successful connection
-            self.reconnect_delay = 5
-            
             return True
         
         except Exception as e:
-            logger.error(f"Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             return False
     
     async def disconnect(self):
@@ -67,156 +102,148 @@ class SignalClient:
             logger.info("Disconnected from broadcaster")
     
     async def start(self):
-        """Start receiving signals with auto-reconnection."""
+        """
+        Start receiving signals with auto-reconnection.
+        
+        Iterating over ``websockets.connect()`` retries failed connection
+        attempts with the library's own backoff. When an open connection
+        is closed, the client waits ``reconnect_delay`` seconds before
+        reconnecting, doubling it each time up to ``max_reconnect_delay``;
+        the delay resets once a connection has stayed up for
+        ``stable_connection_time`` seconds. The outer loop handles errors
+        the library treats as fatal (e.g. a rejected handshake).
+        """
         self.running = True
+        loop = asyncio.get_running_loop()
         
         while self.running:
             try:
-                # Connect to broadcaster
-                connected = await self.connect()
+                logger.info("Connecting to broadcaster: %s", self._ws_url())
                 
-                if not connected:
-                    logger.warning(f"Connection failed. Retrying in {self.reconnect_delay}s...")
-                    await asyncio.sleep(self.reconnect_delay)
-                    # Exponential backoff
-                    self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
-                    continue
-                
-                # Start ping task
-                ping_task = asyncio.create_task(self._ping_loop())
-                
-                # Listen for messages
-                try:
-                    async for message in self.ws:
-                        await self._handle_message(message)
-                
-                except websockets.exceptions.ConnectionClosed:
-                    logger.warning("Connection closed by server")
-                
-                finally:
-                    ping_task.cancel()
+                async for ws in self._connect():
+                    self.ws = ws
+                    connected_at = loop.time()
+                    logger.info("✅ Connected to broadcaster")
                     
-                    if self.on_disconnected:
-                        await self.on_disconnected()
-                
-                # Reconnect if still running
-                if self.running:
-                    logger.info(f"Reconnecting in {self.reconnect_delay}s...")
+                    try:
+                        if self.on_connected:
+                            await self.on_connected()
+                        
+                        # Listen for messages, as raw bytes (no str decode before parsing)
+                        while True:
+                            message = await ws.recv(decode=False)
+                            await self._handle_message(message)
+                    
+                    except websockets.exceptions.ConnectionClosedOK:
+                        pass
+                    
+                    except websockets.exceptions.ConnectionClosed:
+                        logger.warning("Connection closed by server")
+                    
+                    finally:
+                        self.ws = None
+                        if self.on_disconnected:
+                            await self.on_disconnected()
+                    
+                    if not self.running:
+                        break
+                    
+                    # The library only backs off after failed attempts, so
+                    # a server that accepts and then drops us is throttled here
+                    if loop.time() - connected_at >= self.stable_connection_time:
+                        self.reconnect_delay = 5
+                    logger.info("Reconnecting in %ss...", self.reconnect_delay)
                     await asyncio.sleep(self.reconnect_delay)
+                    self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
+                    if not self.running:
+                        break
             
             except Exception as e:
-                logger.error(f"Error in client loop: {e}", exc_info=True)
-                await asyncio.sleep(self.reconnect_delay)
-    
-    async def _ping_loop(self):
-        """Send periodic pings to keep connection alive."""
-        try:
-            while self.running and self.ws:
-                await asyncio.sleep(30)
-                if self.ws:
-                    await self.ws.send("ping")
-                    logger.debug("Sent ping")
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.error(f"Error in ping loop: {e}")
+                logger.error("Error in client loop: %s", e, exc_info=True)
+                if self.running:
+                    logger.warning("Retrying in %ss...", self.reconnect_delay)
+                    await asyncio.sleep(self.reconnect_delay)
+                    # Exponential backoff
+                    self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
     
-    async def _handle_message(self, message: str):
+    async def _handle_message(self, message: bytes | str):
         """Handle incoming message from broadcaster."""
         try:
-            # Handle pong response
-            if message == "pong":
+            # Skip the parser for the "pong" control frame; everything
+            # else (including JSON with leading whitespace) is parsed
+            if message == b"pong" or message == "pong":
                 logger.debug("Received pong")
                 return
             
-            # Parse JSON message
-            data = json.loads(message)
+            # Parse JSON message (both parsers accept bytes)
+            data = _json.loads(message)
             msg_type = data.get("type")
             
-            logger.info(f"📨 Received: {msg_type}")
+            logger.info("📨 Received: %s", msg_type)
             
             # Route to appropriate handler
-            if msg_type == "NEW_SIGNAL":
-                await self._handle_new_signal(data)
-            
-            elif msg_type == "CLOSE_SIGNAL":
-                await self._handle_close_signal(data)
-            
-            elif msg_type == "EDIT_SLTP":
-                await self._handle_edit_sltp(data)
-            
-            elif msg_type == "UPDATE_LEVERAGE":
-                await self._handle_leverage(data)
-            
+            handler = self._dispatch.get(msg_type)
+            if handler:
+                await handler(data)
             else:
-                logger.warning(f"Unknown message type: {msg_type}")
+                logger.warning("Unknown message type: %s", msg_type)
         
-        except json.JSONDecodeError:
-            logger.error(f"Failed to parse message: {message}")
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+            logger.error("Failed to parse message: %r", message)
         
         except Exception as e:
-            logger.error(f"Error handling message: {e}", exc_info=True)
+            logger.error("Error handling message: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
     
     async def _handle_new_signal(self, data: dict):
         """Handle NEW_SIGNAL message."""
         try:
             signal = Signal.from_dict(data["signal"])
-            logger.info(f"📡 New Signal: {signal.signal_type.value} {signal.symbol} @ {signal.entry_price or 'Market'}")
+            logger.info(
+                "📡 New Signal: %s %s @ %s",
+                signal.signal_type.value, signal.symbol, signal.entry_price or "Market"
+            )
             
             if self.on_signal:
                 await self.on_signal(signal)
         
         except Exception as e:
-            logger.error(f"Error handling new signal: {e}", exc_info=True)
+            logger.error("Error handling new signal: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
     
     async def _handle_close_signal(self, data: dict):
         """Handle CLOSE_SIGNAL message."""
         try:
-            close = CloseCommand(
-                signal_id=data["signal_id"],
-                symbol=data["symbol"],
-                percentage=data.get("percentage", 100.0)
-            )
+            close = CloseCommand(data["signal_id"], data["symbol"], data.get("percentage", 100.0))
             
-            logger.info(f"🔒 Close Signal: {close.signal_id} ({close.percentage}%)")
+            logger.info("🔒 Close Signal: %s (%s%%)", close.signal_id, close.percentage)
             
             if self.on_close:
                 await self.on_close(close)
         
         except Exception as e:
-            logger.error(f"Error handling close signal: {e}", exc_info=True)
+            logger.error("Error handling close signal: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
     
     async def _handle_edit_sltp(self, data: dict):
         """Handle EDIT_SLTP message."""
         try:
-            edit = EditSLTPCommand(
-                signal_id=data["signal_id"],
-                symbol=data["symbol"],
-                stop_loss=data.get("stop_loss"),
-                take_profit=data.get("take_profit")
-            )
+            edit = EditSLTPCommand(data["signal_id"], data["symbol"], data.get("stop_loss"), data.get("take_profit"))
             
-            logger.info(f"✏️ Edit SL/TP: {edit.signal_id}")
+            logger.info("✏️ Edit SL/TP: %s", edit.signal_id)
             
             if self.on_edit_sltp:
                 await self.on_edit_sltp(edit)
         
         except Exception as e:
-            logger.error(f"Error handling edit SL/TP: {e}", exc_info=True)
+            logger.error("Error handling edit SL/TP: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
     
     async def _handle_leverage(self, data: dict):
         """Handle UPDATE_LEVERAGE message."""
         try:
-            lev = LeverageCommand(
-                signal_id=data["signal_id"],
-                symbol=data["symbol"],
-                leverage=data["leverage"]
-            )
+            lev = LeverageCommand(data["signal_id"], data["symbol"], data["leverage"])
             
-            logger.info(f"⚡ Update Leverage: {lev.signal_id} → {lev.leverage}x")
+            logger.info("⚡ Update Leverage: %s → %sx", lev.signal_id, lev.leverage)
             
             if self.on_leverage:
                 await self.on_leverage(lev)
         
         except Exception as e:
-            logger.error(f"Error handling leverage update: {e}", exc_info=True)
+            logger.error("Error handling leverage update: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
@@ -3,131 +3,382 @@ Configuration management for SDK.
 """
 
 import os
-import toml
-import uuid
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field
-from dotenv import load_dotenv
+from typing import Optional, Union, get_origin
 
-load_dotenv()
+from .constants import BROADCASTER_URL
 
+# .env is only read when configuration actually comes from the environment
+_dotenv_loaded = False
 
-class BroadcasterConfig(BaseModel):
+# Bump when the cached payload layout changes
+_CACHE_FORMAT = 5
+_SECTIONS = ("broadcaster", "mudrex", "trading", "risk", "logging")
+
+
+# API secret values that are placeholders rather than real credentials
+_PLACEHOLDER_SECRETS = frozenset({"your_mudrex_api_secret", "your-secret", "api_secret", ""})
+
+
+# Written by Config.generate_example. Kept as pre-serialized TOML (the
+# same output tomli_w produces) so generating it is a single write.
+_EXAMPLE_TOML = f"""\
+[broadcaster]
+url = "{BROADCASTER_URL}"
+client_id = "my-trading-bot-1"
+telegram_id = 123456789
+
+[mudrex]
+api_secret = "your_mudrex_api_secret"
+
+[trading]
+enabled = true
+trade_amount_usdt = 5.0
+max_leverage = 25
+min_order_value = 5.0
+auto_execute = true
+
+[risk]
+max_daily_trades = 999999
+max_open_positions = 999999
+stop_on_daily_loss = 0.0
+min_balance = 0.0
+
+[logging]
+level = "INFO"
+file = "signal_sdk.log"
+console = true
+rotate = true
+rotate_when = "midnight"
+max_bytes = 10485760
+backup_count = 5
+""".encode("utf-8")
+
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment variable ("true" in any case is True)."""
+    return value.lower() == "true"
+
+
+# Environment variable -> (trading setting, cast, default when unset)
+_TRADING_ENV = {
+    "TRADING_ENABLED": ("enabled", _to_bool, True),
+    "TRADE_AMOUNT": ("trade_amount_usdt", float, 5.0),
+    "MAX_LEVERAGE": ("max_leverage", int, 25),
+    "MIN_ORDER_VALUE": ("min_order_value", float, 5.0),
+    "AUTO_EXECUTE": ("auto_execute", _to_bool, True),
+}
+
+
+def _new_client_id() -> str:
+    """Generate a client ID for configs that don't set one."""
+    import secrets
+    return f"sdk-{secrets.token_hex(4)}"
+
+
+@dataclass(slots=True)
+class BroadcasterConfig:
     """Broadcaster connection configuration."""
-    url: str = Field(..., description="WebSocket URL of broadcaster")
-    client_id: Optional[str] = Field(None, description="Unique client ID")
-    telegram_id: Optional[int] = Field(None, description="Telegram ID for notifications")
+    url: str = ""  # WebSocket URL of broadcaster
+    client_id: Optional[str] = None  # Unique client ID
+    telegram_id: Optional[int] = None  # Telegram ID for notifications
 
 
-class MudrexConfig(BaseModel):
+@dataclass(slots=True)
+class MudrexConfig:
     """Mudrex API configuration - only api_secret is required."""
-    api_secret: str = Field(..., description="Mudrex API secret")
+    api_secret: str = ""  # Mudrex API secret
 
 
-class TradingConfig(BaseModel):
+@dataclass(slots=True)
+class TradingConfig:
     """Trading parameters."""
-    enabled: bool = Field(True, description="Enable trade execution")
-    trade_amount_usdt: float = Field(5.0, description="Trade amount per signal (minimum: 5.0 USDT)")
-    max_leverage: int = Field(25, description="Maximum leverage")
-    min_order_value: float = Field(5.0, description="Minimum order value (Mudrex requirement: 5.0 USDT)")
-    auto_execute: bool = Field(True, description="Auto-execute trades")
+    enabled: bool = True  # Enable trade execution
+    trade_amount_usdt: float = 5.0  # Trade amount per signal (minimum: 5.0 USDT)
+    max_leverage: int = 25  # Maximum leverage
+    min_order_value: float = 5.0  # Minimum order value (Mudrex requirement: 5.0 USDT)
+    auto_execute: bool = True  # Auto-execute trades
 
 
-class RiskConfig(BaseModel):
+@dataclass(slots=True)
+class RiskConfig:
     """Risk management parameters (disabled by default)."""
-    max_daily_trades: int = Field(999999, description="Max trades per day (disabled: 999999)")
-    max_open_positions: int = Field(999999, description="Max open positions (disabled: 999999)")
-    stop_on_daily_loss: float = Field(0.0, description="Stop on daily loss (0=disabled)")
-    min_balance: float = Field(0.0, description="Minimum balance to trade (disabled: 0.0)")
+    max_daily_trades: int = 999999  # Max trades per day (disabled: 999999)
+    max_open_positions: int = 999999  # Max open positions (disabled: 999999)
+    stop_on_daily_loss: float = 0.0  # Stop on daily loss (0=disabled)
+    min_balance: float = 0.0  # Minimum balance to trade (disabled: 0.0)
 
 
-class LoggingConfig(BaseModel):
+@dataclass(slots=True)
+class LoggingConfig:
     """Logging configuration."""
-    level: str = Field("INFO", description="Log level")
-    file: str = Field("signal_sdk.log", description="Log file path")
-    console: bool = Field(True, description="Log to console")
-    rotate: bool = Field(True, description="Rotate log files")
-    max_bytes: int = Field(10485760, description="Max log file size")
-    backup_count: int = Field(5, description="Number of backup files")
+    level: str = "INFO"  # Log level
+    file: str = "signal_sdk.log"  # Log file path
+    console: bool = True  # Log to console
+    rotate: bool = True  # Rotate log files
+    rotate_when: str = "midnight"  # Rotation interval ('midnight', 'h', 'd', ...) or 'size'
+    max_bytes: int = 10485760  # Max log file size (rotate_when = 'size')
+    backup_count: int = 5  # Number of backup files
+
+
+_SECTION_TYPES = (BroadcasterConfig, MudrexConfig, TradingConfig, RiskConfig, LoggingConfig)
+
+# Section class -> {field name: (type, optional)}; unknown keys in a
+# section are ignored rather than rejected
+_FIELD_TYPES = {
+    cls: {
+        f.name: (f.type.__args__[0], True) if get_origin(f.type) is Union else (f.type, False)
+        for f in fields(cls)
+    }
+    for cls in _SECTION_TYPES
+}
+
+
+def _section(cls, data: dict):
+    """Build a section from its raw settings, skipping unknown keys."""
+    known = _FIELD_TYPES[cls]
+    return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def _check_value(value, tp):
+    """Return ``value`` as type ``tp``, or raise ValueError/TypeError."""
+    if tp is bool:
+        if type(value) is not bool:
+            raise TypeError("expected a boolean")
+        return value
+    if tp is str:
+        if not isinstance(value, str):
+            raise TypeError("expected a string")
+        return value
+    # int/float: numbers and numeric strings, but not booleans
+    if type(value) is bool or not isinstance(value, (int, float, str)):
+        raise TypeError(f"expected {'an integer' if tp is int else 'a number'}")
+    if tp is int and isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError("expected an integer")
+        return int(value)
+    return tp(value)
+
+
+def _check_section(name: str, section) -> list[str]:
+    """Type-check a section in place, converting compatible values."""
+    errors = []
+    for field, (tp, optional) in _FIELD_TYPES[type(section)].items():
+        value = getattr(section, field)
+        if value is None and optional:
+            continue
+        try:
+            setattr(section, field, _check_value(value, tp))
+        except (TypeError, ValueError) as e:
+            errors.append(f"{name}.{field}: {e}")
+    return errors
 
 
 class Config:
-    """Main configuration class."""
+    """
+    Main configuration class.
+    
+    Config files and the environment are trusted local sources, so by
+    default sections are built without checking value types;
+    ``validate()`` checks them once. Pass ``trusted=False`` to raise
+    ``ValueError`` for invalid settings while loading instead.
+    """
+    
+    # Cached result of validate()
+    _validation: Optional[tuple[bool, list[str]]] = None
     
-    def __init__(self, config_path: str = "config.toml"):
+    def __init__(self, config_path: str = "config.toml", trusted: bool = True):
         self.config_path = Path(config_path)
+        self.trusted = trusted
         self._load_config()
     
+    @classmethod
+    def from_dict(cls, data: dict, config_path: str = "config.toml", trusted: bool = True) -> "Config":
+        """Create configuration from an already-parsed config dictionary."""
+        config = cls.__new__(cls)
+        config.config_path = Path(config_path)
+        config.trusted = trusted
+        config._load_from_dict(data)
+        return config
+    
+    @property
+    def cache_path(self) -> Path:
+        """
+        File holding the parsed contents of the config file.
+        
+        It contains the API secret, so it lives in the user's cache
+        directory rather than next to the config, where it could end up
+        in a Docker build context or a commit.
+        """
+        import hashlib
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tia_sdk"
+        digest = hashlib.sha256(os.fsencode(self.config_path.resolve())).hexdigest()[:32]
+        return cache_dir / f"config-{digest}.json"
+    
     def _load_config(self):
         """Load configuration from file or environment."""
-        if self.config_path.exists():
-            # Load from TOML file
-            data = toml.load(self.config_path)
-            self._load_from_dict(data)
-        else:
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             # Load from environment variables
             self._load_from_env()
+            return
+        
+        # Load from TOML file, unless its parsed contents are cached.
+        # Defaults are applied on every load, so they are never cached.
+        key = self._cache_key(st)
+        data = self._load_from_cache(key)
+        if data is None:
+            import tomllib
+            data = tomllib.loads(self.config_path.read_bytes().decode("utf-8"))
+            self._write_cache(key, data)
+        self._load_from_dict(data)
+    
+    @staticmethod
+    def _cache_key(st: os.stat_result) -> list:
+        """Key the cache on the file's mtime and size and the SDK version."""
+        from . import __version__
+        return [_CACHE_FORMAT, __version__, st.st_mtime_ns, st.st_size]
+    
+    def invalidate_cache(self):
+        """Remove the cache file so the next load reparses the config file."""
+        try:
+            self.cache_path.unlink()
+        except (OSError, RuntimeError):  # RuntimeError: no home directory
+            pass
+    
+    def _load_from_cache(self, key: list) -> Optional[dict]:
+        """Return the cached config file contents, or None on a miss."""
+        import json
+        
+        try:
+            cached = json.loads(self.cache_path.read_bytes())
+            if cached["key"] == key:
+                return cached["data"]
+        except Exception:
+            pass
+        return None
+    
+    def _write_cache(self, key: list, data: dict):
+        """Atomically write the cache file. Failures only cost a reparse next time."""
+        import json
+        
+        try:
+            payload = json.dumps({"key": key, "data": data}).encode("utf-8")
+        except (TypeError, ValueError):
+            # TOML dates and times have no JSON form; such files aren't cached
+            return
+        
+        try:
+            cache_path = self.cache_path
+        except RuntimeError:  # no home directory
+            return
+        tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+    
+    def _build(self, sections: dict):
+        """Create the section objects from their raw settings."""
+        for name, cls in zip(_SECTIONS, _SECTION_TYPES):
+            setattr(self, name, _section(cls, sections[name]))
+        if not self.trusted:
+            errors = self._check_types()
+            if errors:
+                raise ValueError("Invalid configuration: " + "; ".join(errors))
     
     def _load_from_dict(self, data: dict):
         """Load configuration from dictionary."""
-        from .constants import BROADCASTER_URL
-        
         # Generate client_id if not provided
-        broadcaster_data = data.get("broadcaster", {})
-        if "client_id" not in broadcaster_data or not broadcaster_data["client_id"]:
-            broadcaster_data["client_id"] = f"sdk-{uuid.uuid4().hex[:8]}"
+        broadcaster_data = dict(data.get("broadcaster", {}))
+        if not broadcaster_data.get("client_id"):
+            broadcaster_data["client_id"] = _new_client_id()
         
         # Use default broadcaster URL if not provided
         if "url" not in broadcaster_data or not broadcaster_data["url"]:
             broadcaster_data["url"] = BROADCASTER_URL
         
-        self.broadcaster = BroadcasterConfig(**broadcaster_data)
-        self.mudrex = MudrexConfig(**data.get("mudrex", {}))
-        self.trading = TradingConfig(**data.get("trading", {}))
-        self.risk = RiskConfig(**data.get("risk", {}))
-        self.logging = LoggingConfig(**data.get("logging", {}))
+        self._build({
+            "broadcaster": broadcaster_data,
+            "mudrex": data.get("mudrex", {}),
+            "trading": data.get("trading", {}),
+            "risk": data.get("risk", {}),
+            "logging": data.get("logging", {}),
+        })
     
     def _load_from_env(self):
         """Load configuration from environment variables."""
-        from .constants import BROADCASTER_URL
-        
-        self.broadcaster = BroadcasterConfig(
-            url=os.getenv("BROADCASTER_URL", BROADCASTER_URL),
-            client_id=os.getenv("CLIENT_ID", f"sdk-{uuid.uuid4().hex[:8]}"),
-            telegram_id=int(os.getenv("TELEGRAM_ID")) if os.getenv("TELEGRAM_ID") else None
-        )
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _dotenv_loaded = True
         
-        self.mudrex = MudrexConfig(
-            api_secret=os.getenv("MUDREX_API_SECRET", "")
-        )
-        
-        self.trading = TradingConfig(
-            enabled=os.getenv("TRADING_ENABLED", "true").lower() == "true",
-            trade_amount_usdt=float(os.getenv("TRADE_AMOUNT", "5.0")),
-            max_leverage=int(os.getenv("MAX_LEVERAGE", "25")),
-            min_order_value=float(os.getenv("MIN_ORDER_VALUE", "5.0")),
-            auto_execute=os.getenv("AUTO_EXECUTE", "true").lower() == "true"
-        )
+        # Each variable is looked up exactly once
+        env = os.environ
+        trading = {
+            field: cast(env[name]) if name in env else default
+            for name, (field, cast, default) in _TRADING_ENV.items()
+        }
+        telegram_id = env.get("TELEGRAM_ID")
         
-        self.risk = RiskConfig(
-            max_daily_trades=999999,
-            max_open_positions=999999,
-            stop_on_daily_loss=0.0,
-            min_balance=0.0
-        )
-        self.logging = LoggingConfig(
-            level=os.getenv("LOG_LEVEL", "INFO")
-        )
+        self._build({
+            "broadcaster": dict(
+                url=env.get("BROADCASTER_URL", BROADCASTER_URL),
+                client_id=env.get("CLIENT_ID") or _new_client_id(),
+                telegram_id=int(telegram_id) if telegram_id else None
+            ),
+            "mudrex": dict(
+                api_secret=env.get("MUDREX_API_SECRET", "")
+            ),
+            "trading": trading,
+            "risk": dict(
+                max_daily_trades=999999,
+                max_open_positions=999999,
+                stop_on_daily_loss=0.0,
+                min_balance=0.0
+            ),
+            "logging": dict(
+                level=env.get("LOG_LEVEL", "INFO")
+            ),
+        })
     
     def validate(self) -> tuple[bool, list[str]]:
         """
         Validate configuration.
         
+        The result is computed once per instance, so settings changed in
+        place afterwards are not re-checked.
+        
         Returns:
             (is_valid, errors)
         """
+        if self._validation is None:
+            self._validation = self._compute_validation()
+        return self._validation
+    
+    def _check_types(self) -> list[str]:
+        """Type-check every section, converting compatible values."""
         errors = []
+        for name in _SECTIONS:
+            errors.extend(_check_section(name, getattr(self, name)))
+        return errors
+    
+    def _compute_validation(self) -> tuple[bool, list[str]]:
+        """Run the validation checks."""
+        errors = self._check_types()
+        if errors:
+            # The checks below need well-typed settings
+            return (False, errors)
         
         # Broadcaster validation
         if not self.broadcaster.url:
@@ -136,7 +387,7 @@ class Config:
         # Mudrex validation - only api_secret is required
         if not self.mudrex.api_secret:
             errors.append("Please enter your Mudrex API Secret in config.toml")
-        elif self.mudrex.api_secret.strip() in ["your_mudrex_api_secret", "your-secret", "api_secret", ""]:
+        elif self.mudrex.api_secret.strip() in _PLACEHOLDER_SECRETS:
             errors.append("Please enter your actual Mudrex API Secret (not a placeholder)")
         
         # Trading validation
@@ -148,41 +399,5 @@ class Config:
     @staticmethod
     def generate_example(output_path: str = "config.example.toml"):
         """Generate example configuration file."""
-        from .constants import BROADCASTER_URL
-        
-        example = {
-            "broadcaster": {
-                "url": BROADCASTER_URL,
-                "client_id": "my-trading-bot-1",
-                "telegram_id": 123456789
-            },
-            "mudrex": {
-                "api_secret": "your_mudrex_api_secret"
-            },
-            "trading": {
-                "enabled": True,
-                "trade_amount_usdt": 5.0,
-                "max_leverage": 25,
-                "min_order_value": 5.0,
-                "auto_execute": True
-            },
-            "risk": {
-                "max_daily_trades": 999999,
-                "max_open_positions": 999999,
-                "stop_on_daily_loss": 0.0,
-                "min_balance": 0.0
-            },
-            "logging": {
-                "level": "INFO",
-                "file": "signal_sdk.log",
-                "console": True,
-                "rotate": True,
-                "max_bytes": 10485760,
-                "backup_count": 5
-            }
-        }
-        
-        with open(output_path, "w") as f:
-            toml.dump(example, f)
-        
+        Path(output_path).write_bytes(_EXAMPLE_TOML)
         return output_path
@@ -4,9 +4,12 @@ Trade executor - executes trades on Mudrex using local API keys.
 
 import logging
 import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_HALF_EVEN, Decimal
 from typing import Optional
-from datetime import datetime, timedelta
-from mudrex import MudrexClient
+from datetime import date, datetime, timedelta
 
 from .config import Config
 from .models import (
@@ -16,32 +19,160 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Order side sent to Mudrex for each signal type
+_SIDE_MAP = {SignalType.LONG: "LONG", SignalType.SHORT: "SHORT"}
+
+
+_ONE = Decimal(1)
+
+
+@functools.lru_cache(maxsize=1024)
+def _qty_step(quantity_step) -> Decimal:
+    """An asset's quantity step as a normalized Decimal ("0.0010" -> 0.001)."""
+    return Decimal(str(quantity_step)).normalize()
+
+
+def _step_quantity(quantity: float, step: Decimal) -> tuple[float, str]:
+    """
+    Round a quantity to the nearest multiple of the asset's step.
+    
+    Decimal arithmetic keeps the result an exact multiple of the step.
+    The string has exactly the step's decimal places ("0.250" for step
+    0.001), or none for whole-number steps.
+    
+    Returns:
+        (quantity, quantity_str)
+    """
+    stepped = (Decimal(str(quantity)) / step).to_integral_value(rounding=ROUND_HALF_EVEN) * step
+    # Division and multiplication keep the inputs' exponents; pin the result to the step's
+    stepped = stepped.quantize(step if step.as_tuple().exponent < 0 else _ONE)
+    return float(stepped), format(stepped, "f")
+
+
+def _next_midnight() -> float:
+    """Unix timestamp of the next local midnight."""
+    return datetime.combine(date.today() + timedelta(days=1), datetime.min.time()).timestamp()
+
 
 class TradeExecutor:
     """Executes trades on Mudrex based on signals."""
     
     def __init__(self, config: Config):
         self.config = config
+        # Imported here so importing this module doesn't load the Mudrex SDK
+        from mudrex import MudrexClient
+        
         # MudrexClient only takes api_secret (not api_key)
         self.client = MudrexClient(
             api_secret=config.mudrex.api_secret
         )
         
+        # Worker threads for the blocking Mudrex SDK calls, separate from
+        # the event loop's default executor
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mudrex")
+        
         # Track state
         self.daily_trades = 0
         self.daily_loss = 0.0
-        self.last_reset = datetime.now().date()
+        self.last_reset = date.today()
+        self._next_reset = _next_midnight()
         self.open_positions: dict[str, Signal] = {}  # signal_id -> Signal
         
+        # (fetched_at, {symbol: position}) from the last list_open call
+        self._positions_cache: Optional[tuple[float, dict]] = None
+        
+        # (fetched_at, available balance) from the last balance check
+        self._balance_cache: Optional[tuple[float, float]] = None
+        
+        # symbol -> (fetched_at, (asset, qty_step))
+        self._asset_cache: dict[str, tuple[float, tuple]] = {}
+        
         logger.info("TradeExecutor initialized")
     
+    async def _call(self, fn, *args, **kwargs):
+        """Run a blocking Mudrex SDK call on the executor's thread pool."""
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+    
+    async def _get_positions_by_symbol(self, ttl: float = 1.0) -> dict:
+        """
+        Open positions keyed by symbol.
+        
+        A list_open result up to ``ttl`` seconds old is reused; pass
+        ``ttl=0`` to force a fresh fetch.
+        """
+        cached = self._positions_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        positions = await self._call(self.client.positions.list_open)
+        # reversed() so the first position listed for a symbol wins
+        by_symbol = {p.symbol: p for p in reversed(positions)}
+        self._positions_cache = (time.monotonic(), by_symbol)
+        return by_symbol
+    
+    async def _get_available_balance(self, ttl: float = 2.0) -> float:
+        """Available futures balance, reusing a fetch up to ``ttl`` seconds old."""
+        cached = self._balance_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        balance = await self._call(self.client.wallet.get_futures_balance)
+        available = float(balance.available)  # mudrex library uses .available
+        self._balance_cache = (time.monotonic(), available)
+        return available
+    
+    async def _get_asset(self, symbol: str, ttl: float = 300.0) -> tuple:
+        """
+        Asset info for ``symbol``, reusing a fetch up to ``ttl`` seconds old.
+        
+        Step sizes rarely change, but ``mark_price`` does: callers that
+        need the current price pass ``ttl=0``.
+        
+        Returns:
+            (asset, qty_step) - qty_step is the asset's quantity step as
+            a Decimal, or None if it has none
+        """
+        cached = self._asset_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        asset = await self._call(self.client.assets.get, symbol)
+        if not asset:
+            return None, None
+        entry = (asset, _qty_step(asset.quantity_step) if asset.quantity_step else None)
+        self._asset_cache[symbol] = (time.monotonic(), entry)
+        return entry
+    
+    async def _await_position(self, symbol: str, timeout: float = 3.0, poll: float = 0.1):
+        """
+        Poll open positions until ``symbol`` shows up.
+        
+        Returns:
+            The position, or None if it did not appear within ``timeout`` seconds
+        """
+        async def wait():
+            while True:
+                position = (await self._get_positions_by_symbol(ttl=0)).get(symbol)
+                if position:
+                    return position
+                await asyncio.sleep(poll)
+        
+        try:
+            return await asyncio.wait_for(wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    def _invalidate_positions(self):
+        """Forget cached positions after opening or closing one."""
+        self._positions_cache = None
+    
     def _reset_daily_counters(self):
         """Reset daily counters if new day."""
-        today = datetime.now().date()
-        if today != self.last_reset:
+        # A float compare per signal; dates are only built at midnight
+        if time.time() >= self._next_reset:
             self.daily_trades = 0
             self.daily_loss = 0.0
-            self.last_reset = today
+            self.last_reset = date.today()
+            self._next_reset = _next_midnight()
             logger.info("Daily counters reset")
     
     async def _check_risk_limits(self) -> tuple[bool, str]:
@@ -73,13 +204,12 @@ class TradeExecutor:
         # Check balance (disabled if 0.0)
         if self.config.risk.min_balance > 0:
             try:
-                balance = await asyncio.to_thread(self.client.wallet.get_futures_balance)
-                available_balance = float(balance.available)  # mudrex library uses .available
+                available_balance = await self._get_available_balance()
                 
                 if available_balance < self.config.risk.min_balance:
                     return False, f"Balance too low ({available_balance:.2f} < {self.config.risk.min_balance} USDT)"
             except Exception as e:
-                logger.error(f"Failed to check balance: {e}")
+                logger.error("Failed to check balance: %s", e)
                 return False, f"Failed to check balance: {str(e)}"
         
         return True, "OK"
@@ -91,7 +221,7 @@ class TradeExecutor:
         Returns:
             TradeResult with execution details
         """
-        logger.info(f"🎯 Executing signal: {signal.signal_type.value} {signal.symbol}")
+        logger.info("🎯 Executing signal: %s %s", signal.signal_type.value, signal.symbol)
         
         # Check if auto-execute is enabled
         if not self.config.trading.auto_execute:
@@ -106,7 +236,7 @@ class TradeExecutor:
         # Check risk limits
         can_trade, reason = await self._check_risk_limits()
         if not can_trade:
-            logger.warning(f"Risk limit check failed: {reason}")
+            logger.warning("Risk limit check failed: %s", reason)
             return TradeResult(
                 signal_id=signal.signal_id,
                 symbol=signal.symbol,
@@ -115,12 +245,18 @@ class TradeExecutor:
             )
         
         try:
+            # Open positions and asset info are independent - fetch concurrently
+            positions, (asset, qty_step) = await asyncio.gather(
+                self._get_positions_by_symbol(),
+                # Market orders are sized from the live mark price
+                self._get_asset(signal.symbol, ttl=0 if signal.order_type == OrderType.MARKET else 300.0)
+            )
+            
             # Check if position already exists
-            positions = await asyncio.to_thread(self.client.positions.list_open)
-            existing = next((p for p in positions if p.symbol == signal.symbol), None)
+            existing = positions.get(signal.symbol)
             
             if existing:
-                logger.warning(f"Position already exists for {signal.symbol}")
+                logger.warning("Position already exists for %s", signal.symbol)
                 return TradeResult(
                     signal_id=signal.signal_id,
                     symbol=signal.symbol,
@@ -128,8 +264,6 @@ class TradeExecutor:
                     message=f"Position already exists for {signal.symbol}"
                 )
             
-            # Get asset info
-            asset = await asyncio.to_thread(self.client.assets.get, signal.symbol)
             if not asset:
                 return TradeResult(
                     signal_id=signal.signal_id,
@@ -148,24 +282,27 @@ class TradeExecutor:
             # Calculate quantity
             quantity = (trade_amount * leverage) / entry_price
             
-            # Round to quantity step
-            if asset.quantity_step:
-                qty_step = float(asset.quantity_step)
-                quantity = round(quantity / qty_step) * qty_step
-            
-            # Format quantity
-            if asset.quantity_step and float(asset.quantity_step) < 1:
-                precision = len(str(float(asset.quantity_step)).split('.')[-1].rstrip('0'))
-                quantity_str = f"{quantity:.{precision}f}"
+            # Round to quantity step and format
+            if qty_step:
+                quantity, quantity_str = _step_quantity(quantity, qty_step)
             else:
                 quantity_str = str(int(quantity))
             
+            if float(quantity_str) <= 0:
+                logger.warning("Order quantity for %s rounds to zero", signal.symbol)
+                return TradeResult(
+                    signal_id=signal.signal_id,
+                    symbol=signal.symbol,
+                    success=False,
+                    message=f"Order quantity for {signal.symbol} rounds to zero - increase trade_amount_usdt"
+                )
+            
             # Determine side - use string value, not Enum
-            side = "LONG" if signal.signal_type == SignalType.LONG else "SHORT"
+            side = _SIDE_MAP[signal.signal_type]
             
             # Place order using correct method names
             if signal.order_type == OrderType.MARKET:
-                order = await asyncio.to_thread(
+                order = await self._call(
                     self.client.orders.create_market_order,
                     symbol=signal.symbol,
                     side=side,
@@ -173,7 +310,7 @@ class TradeExecutor:
                     leverage=leverage
                 )
             else:
-                order = await asyncio.to_thread(
+                order = await self._call(
                     self.client.orders.create_limit_order,
                     symbol=signal.symbol,
                     side=side,
@@ -182,32 +319,35 @@ class TradeExecutor:
                     leverage=leverage
                 )
             
+            # The order changed both positions and margin
+            self._invalidate_positions()
+            self._balance_cache = None
+            
             # Set SL/TP if provided
             if signal.stop_loss or signal.take_profit:
-                # Wait a moment for position to be created
-                await asyncio.sleep(2)
-                
-                positions = await asyncio.to_thread(self.client.positions.list_open)
-                position = next((p for p in positions if p.symbol == signal.symbol), None)
+                # Wait for the position to be created
+                position = await self._await_position(signal.symbol)
                 
                 if position:
                     sl_price = str(signal.stop_loss) if signal.stop_loss else None
                     tp_price = str(signal.take_profit) if signal.take_profit else None
                     
-                    await asyncio.to_thread(
+                    await self._call(
                         self.client.positions.set_risk_order,
                         position_id=position.position_id,
                         stoploss_price=sl_price,
                         takeprofit_price=tp_price
                     )
                     
-                    logger.info(f"Set SL/TP for {signal.symbol}: SL={sl_price}, TP={tp_price}")
+                    logger.info("Set SL/TP for %s: SL=%s, TP=%s", signal.symbol, sl_price, tp_price)
+                else:
+                    logger.warning("No position for %s yet - SL/TP not set", signal.symbol)
             
             # Track position
             self.open_positions[signal.signal_id] = signal
             self.daily_trades += 1
             
-            logger.info(f"✅ Trade executed: {signal.symbol} {side} {quantity_str} @ {entry_price}")
+            logger.info("✅ Trade executed: %s %s %s @ %s", signal.symbol, side, quantity_str, entry_price)
             
             return TradeResult(
                 signal_id=signal.signal_id,
@@ -220,7 +360,7 @@ class TradeExecutor:
             )
         
         except Exception as e:
-            logger.error(f"Failed to execute trade: {e}", exc_info=True)
+            logger.error("Failed to execute trade: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return TradeResult(
                 signal_id=signal.signal_id,
                 symbol=signal.symbol,
@@ -230,12 +370,12 @@ class TradeExecutor:
     
     async def close_position(self, close: CloseCommand) -> TradeResult:
         """Close a position (full or partial)."""
-        logger.info(f"🔒 Closing position: {close.symbol} ({close.percentage}%)")
+        logger.info("🔒 Closing position: %s (%s%%)", close.symbol, close.percentage)
         
         try:
             # Find position
-            positions = await asyncio.to_thread(self.client.positions.list_open)
-            position = next((p for p in positions if p.symbol == close.symbol), None)
+            positions = await self._get_positions_by_symbol()
+            position = positions.get(close.symbol)
             
             if not position:
                 return TradeResult(
@@ -248,35 +388,39 @@ class TradeExecutor:
             # Close position
             if close.percentage >= 100:
                 # Full close
-                result = await asyncio.to_thread(
+                result = await self._call(
                     self.client.positions.close,
                     position.position_id
                 )
-                logger.info(f"✅ Position closed: {close.symbol}")
+                logger.info("✅ Position closed: %s", close.symbol)
             else:
                 # Partial close
                 close_qty = float(position.quantity) * (close.percentage / 100.0)
                 
                 # Round to quantity step
-                asset = await asyncio.to_thread(self.client.assets.get, close.symbol)
-                if asset and asset.quantity_step:
-                    qty_step = float(asset.quantity_step)
-                    close_qty = round(close_qty / qty_step) * qty_step
-                    
-                    if float(asset.quantity_step) < 1:
-                        precision = len(str(float(asset.quantity_step)).split('.')[-1].rstrip('0'))
-                        close_qty_str = f"{close_qty:.{precision}f}"
-                    else:
-                        close_qty_str = str(int(close_qty))
+                _, qty_step = await self._get_asset(close.symbol)
+                if qty_step:
+                    close_qty, close_qty_str = _step_quantity(close_qty, qty_step)
                 else:
                     close_qty_str = str(close_qty)
                 
-                result = await asyncio.to_thread(
+                if close_qty <= 0:
+                    return TradeResult(
+                        signal_id=close.signal_id,
+                        symbol=close.symbol,
+                        success=False,
+                        message=f"Close quantity for {close.symbol} rounds to zero"
+                    )
+                
+                result = await self._call(
                     self.client.positions.close_partial,
                     position.position_id,
                     close_qty_str
                 )
-                logger.info(f"✅ Position partially closed: {close.symbol} ({close.percentage}%)")
+                logger.info("✅ Position partially closed: %s (%s%%)", close.symbol, close.percentage)
+            
+            self._invalidate_positions()
+            self._balance_cache = None
             
             # Remove from tracking if fully closed
             if close.percentage >= 100 and close.signal_id in self.open_positions:
@@ -290,7 +434,7 @@ class TradeExecutor:
             )
         
         except Exception as e:
-            logger.error(f"Failed to close position: {e}", exc_info=True)
+            logger.error("Failed to close position: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return TradeResult(
                 signal_id=close.signal_id,
                 symbol=close.symbol,
@@ -300,12 +444,12 @@ class TradeExecutor:
     
     async def update_sl_tp(self, edit: EditSLTPCommand) -> TradeResult:
         """Update SL/TP for a position."""
-        logger.info(f"✏️ Updating SL/TP: {edit.symbol}")
+        logger.info("✏️ Updating SL/TP: %s", edit.symbol)
         
         try:
             # Find position
-            positions = await asyncio.to_thread(self.client.positions.list_open)
-            position = next((p for p in positions if p.symbol == edit.symbol), None)
+            positions = await self._get_positions_by_symbol()
+            position = positions.get(edit.symbol)
             
             if not position:
                 return TradeResult(
@@ -319,14 +463,14 @@ class TradeExecutor:
             sl_price = str(edit.stop_loss) if edit.stop_loss else None
             tp_price = str(edit.take_profit) if edit.take_profit else None
             
-            await asyncio.to_thread(
+            await self._call(
                 self.client.positions.set_risk_order,
                 position_id=position.position_id,
                 stoploss_price=sl_price,
                 takeprofit_price=tp_price
             )
             
-            logger.info(f"✅ SL/TP updated: {edit.symbol}")
+            logger.info("✅ SL/TP updated: %s", edit.symbol)
             
             return TradeResult(
                 signal_id=edit.signal_id,
@@ -336,7 +480,7 @@ class TradeExecutor:
             )
         
         except Exception as e:
-            logger.error(f"Failed to update SL/TP: {e}", exc_info=True)
+            logger.error("Failed to update SL/TP: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return TradeResult(
                 signal_id=edit.signal_id,
                 symbol=edit.symbol,
@@ -346,12 +490,12 @@ class TradeExecutor:
     
     async def update_leverage(self, lev: LeverageCommand) -> TradeResult:
         """Update leverage for a position."""
-        logger.info(f"⚡ Updating leverage: {lev.symbol} → {lev.leverage}x")
+        logger.info("⚡ Updating leverage: %s → %sx", lev.symbol, lev.leverage)
         
         try:
             # Find position
-            positions = await asyncio.to_thread(self.client.positions.list_open)
-            position = next((p for p in positions if p.symbol == lev.symbol), None)
+            positions = await self._get_positions_by_symbol()
+            position = positions.get(lev.symbol)
             
             if not position:
                 return TradeResult(
@@ -373,7 +517,7 @@ class TradeExecutor:
             )
         
         except Exception as e:
-            logger.error(f"Failed to update leverage: {e}", exc_info=True)
+            logger.error("Failed to update leverage: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return TradeResult(
                 signal_id=lev.signal_id,
                 symbol=lev.symbol,
@@ -389,7 +533,7 @@ class TradeExecutor:
             (valid, message)
         """
         try:
-            balance = await asyncio.to_thread(self.client.wallet.get_futures_balance)
+            balance = await self._call(self.client.wallet.get_futures_balance)
             available = float(balance.available)  # mudrex library uses .available
             return True, f"Valid! Balance: {available:.2f} USDT"
         except Exception as e:
@@ -7,6 +7,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
 
 class SignalType(str, Enum):
     """Signal type enum."""
@@ -26,7 +31,22 @@ class SignalStatus(str, Enum):
     CLOSED = "CLOSED"
 
 
-@dataclass
+# Value -> member lookups, cheaper than calling the enum per message
+_SIGNAL_TYPES = {member.value: member for member in SignalType}
+_ORDER_TYPES = {member.value: member for member in OrderType}
+_SIGNAL_STATUSES = {member.value: member for member in SignalStatus}
+_fromisoformat = datetime.fromisoformat
+
+
+def _member(members: dict, enum: type, field: str, value):
+    """Look up an enum member by value, naming the field if it is unknown."""
+    try:
+        return members[value]
+    except KeyError:
+        raise ValueError(f"{field}: {value!r} is not a valid {enum.__name__}") from None
+
+
+@dataclass(slots=True)
 class Signal:
     """Trading signal received from broadcaster."""
     signal_id: str
@@ -44,22 +64,25 @@ class Signal:
     @classmethod
     def from_dict(cls, data: dict) -> 'Signal':
         """Create Signal from broadcaster message."""
+        g = data.get
+        created_at = g("created_at")
+        updated_at = g("updated_at")
         return cls(
             signal_id=data["signal_id"],
             symbol=data["symbol"],
-            signal_type=SignalType(data["signal_type"]),
-            order_type=OrderType(data["order_type"]),
-            entry_price=data.get("entry_price"),
-            stop_loss=data.get("stop_loss"),
-            take_profit=data.get("take_profit"),
-            leverage=data.get("leverage", 1),
-            status=SignalStatus(data.get("status", "ACTIVE")),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None
+            signal_type=_member(_SIGNAL_TYPES, SignalType, "signal_type", data["signal_type"]),
+            order_type=_member(_ORDER_TYPES, OrderType, "order_type", data["order_type"]),
+            entry_price=g("entry_price"),
+            stop_loss=g("stop_loss"),
+            take_profit=g("take_profit"),
+            leverage=g("leverage", 1),
+            status=_member(_SIGNAL_STATUSES, SignalStatus, "status", g("status", "ACTIVE")),
+            created_at=_fromisoformat(created_at) if created_at else None,
+            updated_at=_fromisoformat(updated_at) if updated_at else None
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CloseCommand:
     """Position close command."""
     signal_id: str
@@ -67,7 +90,7 @@ class CloseCommand:
     percentage: float = 100.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EditSLTPCommand:
     """SL/TP edit command."""
     signal_id: str
@@ -76,7 +99,7 @@ class EditSLTPCommand:
     take_profit: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LeverageCommand:
     """Leverage update command."""
     signal_id: str
@@ -84,7 +107,7 @@ class LeverageCommand:
     leverage: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """Result of trade execution."""
     signal_id: str
@@ -108,3 +131,11 @@ class TradeResult:
             "entry_price": self.entry_price,
             "quantity": self.quantity
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON with the same fields as ``to_dict``."""
+        if orjson is not None:
+            # Serializes dataclasses and datetimes natively
+            return orjson.dumps(self)
+        import json
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")